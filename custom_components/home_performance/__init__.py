@@ -7,23 +7,18 @@ and comfort metrics. Supports multiple zones (one config entry per zone).
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.start import async_at_started
 
 from .const import DOMAIN, VERSION
-from .coordinator import HomePerformanceCoordinator
+from .coordinator import HomePerformanceConfigEntry, HomePerformanceCoordinator
 from .frontend import JSModuleRegistration
 
-if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
-
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
@@ -32,6 +27,12 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 SERVICE_RESET_HISTORY = "reset_history"
 SERVICE_RESET_ALL = "reset_all"
 
+# Coordinator method called by each reset service
+RESET_METHODS = {
+    SERVICE_RESET_HISTORY: "reset_history",
+    SERVICE_RESET_ALL: "reset_all_data",
+}
+
 # Service schemas
 RESET_HISTORY_SCHEMA = vol.Schema(
     {
@@ -54,10 +55,16 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     websocket_api.async_register_command(hass, websocket_get_version)
 
     # Setup frontend registration
-    async def _async_setup_frontend(_hass: HomeAssistant) -> None:
-        """Register frontend resources after Home Assistant is started."""
+    @callback
+    def _async_setup_frontend(_hass: HomeAssistant) -> None:
+        """Register frontend resources after Home Assistant is started.
+
+        Runs as a background task: it only registers the static paths and
+        scans Lovelace resources once (later retries, if any, run from
+        timers), and nothing else depends on it.
+        """
         module_register = JSModuleRegistration(hass)
-        await module_register.async_register()
+        hass.async_create_background_task(module_register.async_register(), f"{DOMAIN}_register_frontend")
 
     # async_at_started handles both cases:
     # - If HA is already running: executes immediately
@@ -85,20 +92,24 @@ def websocket_get_version(
     )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: HomePerformanceConfigEntry) -> bool:
     """Set up Home Performance from a config entry."""
     _LOGGER.debug("Setting up Home Performance integration for %s", entry.title)
 
     # Create coordinator for this zone
-    coordinator = HomePerformanceCoordinator(hass, entry)
+    coordinator = HomePerformanceCoordinator(hass, config_entry=entry)
     await coordinator.async_config_entry_first_refresh()
 
+    entry.runtime_data = coordinator
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Index by lowercase zone name for O(1) lookup in services
+    hass.data[DOMAIN].setdefault("_zones_by_name", {})[coordinator.zone_name.lower()] = coordinator
 
     # Register services (only once globally)
-    if "services_registered" not in hass.data[DOMAIN]:
-        await _async_register_services(hass)
+    # Check, registration and flag write don't yield to the event loop,
+    # so zones set up concurrently can't race here
+    if not hass.data[DOMAIN].get("services_registered"):
+        _async_register_services(hass)
         hass.data[DOMAIN]["services_registered"] = True
 
     # Forward to platforms
@@ -110,104 +121,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def _async_options_updated(hass: HomeAssistant, entry: HomePerformanceConfigEntry) -> None:
     """Handle options update - reload the integration."""
     _LOGGER.info("Options updated for %s, reloading", entry.title)
-    await hass.config_entries.async_reload(entry.entry_id)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
 
 
-async def _async_register_services(hass: HomeAssistant) -> None:
-    """Register Home Performance services."""
+def _get_zone_coordinator(hass: HomeAssistant, zone_name: str) -> HomePerformanceCoordinator:
+    """Return the coordinator for a zone name (case-insensitive)."""
+    coordinator = hass.data[DOMAIN].get("_zones_by_name", {}).get(zone_name.lower())
+    if coordinator is None:
+        _LOGGER.warning("Zone not found for reset: %s", zone_name)
+        raise ValueError(f"Zone '{zone_name}' not found")
+    return coordinator
 
-    async def handle_reset_history(call: ServiceCall) -> None:
-        """Handle the reset_history service call.
 
-        Clears the 7-day rolling history for a specific zone.
-        Use after insulation work or to clear anomalous data.
-        """
-        zone_name = call.data["zone_name"]
-        _LOGGER.info("Reset history service called for zone: %s", zone_name)
-
-        # Find the coordinator for this zone
-        skip_keys = ("services_registered", "last_outdoor_temp_sensor")
-        found = False
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if entry_id in skip_keys:
-                continue
-            if isinstance(coordinator, HomePerformanceCoordinator):
-                if coordinator.zone_name.lower() == zone_name.lower():
-                    coordinator.reset_history()
-                    found = True
-                    _LOGGER.info("History reset completed for zone: %s", zone_name)
-                    break
-
-        if not found:
-            _LOGGER.warning("Zone not found for reset: %s", zone_name)
-            raise ValueError(f"Zone '{zone_name}' not found")
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_HISTORY,
-        handle_reset_history,
-        schema=RESET_HISTORY_SCHEMA,
-    )
+async def _async_handle_reset(call: ServiceCall) -> None:
+    """Handle the reset_history and reset_all service calls.
 
-    async def handle_reset_all(call: ServiceCall) -> None:
-        """Handle the reset_all service call.
+    reset_history clears the 7-day rolling history (after insulation work
+    or to clear anomalous data). reset_all completely resets ALL calibration
+    data (when measurements were taken during unusual conditions).
+    """
+    zone_name = call.data["zone_name"]
+    _LOGGER.info("%s service called for zone: %s", call.service, zone_name)
+
+    getattr(_get_zone_coordinator(call.hass, zone_name), RESET_METHODS[call.service])()
+    _LOGGER.info("%s completed for zone: %s", call.service, zone_name)
 
-        Completely resets ALL calibration data for a zone.
-        Use when measurements were taken during unusual conditions.
-        """
-        zone_name = call.data["zone_name"]
-        _LOGGER.info("Reset all data service called for zone: %s", zone_name)
-
-        # Find the coordinator for this zone
-        skip_keys = ("services_registered", "last_outdoor_temp_sensor")
-        found = False
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if entry_id in skip_keys:
-                continue
-            if isinstance(coordinator, HomePerformanceCoordinator):
-                if coordinator.zone_name.lower() == zone_name.lower():
-                    coordinator.reset_all_data()
-                    found = True
-                    _LOGGER.info("Complete data reset completed for zone: %s", zone_name)
-                    break
-
-        if not found:
-            _LOGGER.warning("Zone not found for reset: %s", zone_name)
-            raise ValueError(f"Zone '{zone_name}' not found")
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_ALL,
-        handle_reset_all,
-        schema=RESET_ALL_SCHEMA,
-    )
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register Home Performance services."""
+    for service, schema in (
+        (SERVICE_RESET_HISTORY, RESET_HISTORY_SCHEMA),
+        (SERVICE_RESET_ALL, RESET_ALL_SCHEMA),
+    ):
+        hass.services.async_register(DOMAIN, service, _async_handle_reset, schema=schema)
 
     _LOGGER.info("Home Performance services registered")
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: HomePerformanceConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Home Performance for %s", entry.title)
 
     # Save data before unloading
-    if entry.entry_id in hass.data.get(DOMAIN, {}):
-        coordinator = hass.data[DOMAIN][entry.entry_id]
-        _LOGGER.info("Saving data before unload for zone %s", coordinator.zone_name)
-        try:
-            await coordinator.async_save_data()
-        except Exception as err:
-            _LOGGER.warning("Failed to save data: %s", err)
+    coordinator = entry.runtime_data
+    _LOGGER.info("Saving data before unload for zone %s", coordinator.zone_name)
+    try:
+        await coordinator.async_save_data()
+    except Exception as err:
+        _LOGGER.warning("Failed to save data: %s", err)
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].get("_zones_by_name", {}).pop(coordinator.zone_name.lower(), None)
 
     return unload_ok
-
-
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    return await async_setup_entry(hass, entry)
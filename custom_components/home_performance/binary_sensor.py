@@ -3,31 +3,56 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import BINARY_SENSOR_ENTITY_SUFFIXES, DOMAIN, MIN_DATA_HOURS, VERSION
-from .coordinator import HomePerformanceCoordinator
+from .coordinator import HomePerformanceConfigEntry, HomePerformanceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Constant extra_state_attributes, shared by all entities (read-only)
+_WINDOW_TEMPERATURE_ATTRS: Mapping[str, Any] = MappingProxyType(
+    {
+        "detection_method": "temperature",
+        "description": "Detected via rapid temperature drop",
+    }
+)
+_HEATING_UNKNOWN_ATTRS: Mapping[str, Any] = MappingProxyType(
+    {
+        "heating_hours_today": 0,
+        "heating_ratio": 0,
+        "description": "Heating state unknown",
+    }
+)
+_DATA_LOADING_ATTRS: Mapping[str, Any] = MappingProxyType(
+    {
+        "data_hours": 0,
+        "min_hours_required": MIN_DATA_HOURS,
+        "samples_count": 0,
+        "storage_loaded": False,
+        "description": "Loading data...",
+    }
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: HomePerformanceConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Home Performance binary sensors."""
-    coordinator: HomePerformanceCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     zone_name = coordinator.zone_name
 
     entities = [
@@ -44,17 +69,15 @@ class HomePerformanceBaseBinarySensor(CoordinatorEntity[HomePerformanceCoordinat
 
     _attr_has_entity_name = True
 
-    def __init__(
-        self,
-        coordinator: HomePerformanceCoordinator,
-        zone_name: str,
-        sensor_type: str,
-    ) -> None:
+    # Set by subclasses: sensor type and its standardized entity_id suffix
+    _sensor_type: str
+    _suffix: str
+
+    def __init__(self, coordinator: HomePerformanceCoordinator, zone_name: str) -> None:
         """Initialize the binary sensor."""
         self._zone_name = zone_name
-        self._sensor_type = sensor_type
-        # Use slugify for consistent handling of special characters (ü, é, ç, etc.)
-        zone_slug = slugify(zone_name, separator="_")
+        sensor_type = self._sensor_type
+        zone_slug = coordinator.zone_slug
 
         # Set unique_id and suggested_object_id BEFORE super().__init__()
         # to ensure they are available when the entity is registered
@@ -62,21 +85,18 @@ class HomePerformanceBaseBinarySensor(CoordinatorEntity[HomePerformanceCoordinat
 
         # Suggest standardized entity_id for new installations
         # Existing users keep their current entity_id via Entity Registry
-        suffix = BINARY_SENSOR_ENTITY_SUFFIXES.get(sensor_type, sensor_type)
-        self._attr_suggested_object_id = f"home_performance_{zone_slug}_{suffix}"
+        self._attr_suggested_object_id = f"home_performance_{zone_slug}_{self._suffix}"
 
-        super().__init__(coordinator)
+        # Device info never changes for a zone: build it once
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, zone_name)},
+            name=f"Home Performance - {zone_name}",
+            manufacturer="Home Performance",
+            model="Thermal Analyzer",
+            sw_version=VERSION,
+        )
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._zone_name)},
-            "name": f"Home Performance - {self._zone_name}",
-            "manufacturer": "Home Performance",
-            "model": "Thermal Analyzer",
-            "sw_version": VERSION,
-        }
+        super().__init__(coordinator)
 
 
 class WindowOpenSensor(HomePerformanceBaseBinarySensor):
@@ -85,25 +105,23 @@ class WindowOpenSensor(HomePerformanceBaseBinarySensor):
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:window-open-variant"
     _attr_name = "Window open"
-
-    def __init__(self, coordinator: HomePerformanceCoordinator, zone_name: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, zone_name, "window_open")
+    _sensor_type = "window_open"
+    _suffix = BINARY_SENSOR_ENTITY_SUFFIXES.get("window_open", "window_open")
 
     @property
     def is_on(self) -> bool:
         """Return true if window is detected as open."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("window_open", False)
+        data = self.coordinator.data
+        if data:
+            return data.get("window_open", False)
         return False
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
         # Get detection method from coordinator data
-        detection_method = "temperature"
-        if self.coordinator.data:
-            detection_method = self.coordinator.data.get("window_detection_method", "temperature")
+        data = self.coordinator.data
+        detection_method = data.get("window_detection_method", "temperature") if data else "temperature"
 
         if detection_method == "sensor":
             return {
@@ -111,11 +129,7 @@ class WindowOpenSensor(HomePerformanceBaseBinarySensor):
                 "sensor_entity": self.coordinator.window_sensor,
                 "description": "Using physical window/door contact sensor",
             }
-        else:
-            return {
-                "detection_method": "temperature",
-                "description": "Detected via rapid temperature drop",
-            }
+        return _WINDOW_TEMPERATURE_ATTRS
 
 
 class HeatingActiveSensor(HomePerformanceBaseBinarySensor):
@@ -124,32 +138,28 @@ class HeatingActiveSensor(HomePerformanceBaseBinarySensor):
     _attr_device_class = BinarySensorDeviceClass.HEAT
     _attr_icon = "mdi:fire"
     _attr_name = "Heating active"
-
-    def __init__(self, coordinator: HomePerformanceCoordinator, zone_name: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, zone_name, "heating_active")
+    _sensor_type = "heating_active"
+    _suffix = BINARY_SENSOR_ENTITY_SUFFIXES.get("heating_active", "heating_active")
 
     @property
     def is_on(self) -> bool:
         """Return true if heating is currently active."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("heating_on", False)
+        data = self.coordinator.data
+        if data:
+            return data.get("heating_on", False)
         return False
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data:
+        data = self.coordinator.data
+        if data:
             return {
-                "heating_hours_today": round(self.coordinator.data.get("heating_hours", 0), 2),
-                "heating_ratio": round(self.coordinator.data.get("heating_ratio", 0) * 100, 1),
+                "heating_hours_today": round(data.get("heating_hours", 0), 2),
+                "heating_ratio": round(data.get("heating_ratio", 0) * 100, 1),
                 "description": "Heating is currently running",
             }
-        return {
-            "heating_hours_today": 0,
-            "heating_ratio": 0,
-            "description": "Heating state unknown",
-        }
+        return _HEATING_UNKNOWN_ATTRS
 
 
 class DataReadySensor(HomePerformanceBaseBinarySensor):
@@ -157,16 +167,15 @@ class DataReadySensor(HomePerformanceBaseBinarySensor):
 
     _attr_icon = "mdi:database-check"
     _attr_name = "Data ready"
-
-    def __init__(self, coordinator: HomePerformanceCoordinator, zone_name: str) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, zone_name, "data_ready")
+    _sensor_type = "data_ready"
+    _suffix = BINARY_SENSOR_ENTITY_SUFFIXES.get("data_ready", "data_ready")
 
     @property
     def is_on(self) -> bool:
         """Return true if enough data has been collected."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("data_ready", False)
+        data = self.coordinator.data
+        if data:
+            return data.get("data_ready", False)
         return False
 
     @property
@@ -177,23 +186,17 @@ class DataReadySensor(HomePerformanceBaseBinarySensor):
         return "mdi:database-clock"
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data:
-            data_hours = self.coordinator.data.get("data_hours", 0)
-            storage_loaded = self.coordinator.data.get("storage_loaded", False)
+        data = self.coordinator.data
+        if data:
+            data_hours = data.get("data_hours", 0)
             return {
                 "data_hours": round(data_hours, 1) if data_hours else 0,
                 "min_hours_required": MIN_DATA_HOURS,
-                "samples_count": self.coordinator.data.get("samples_count", 0),
-                "storage_loaded": storage_loaded,
+                "samples_count": data.get("samples_count", 0),
+                "storage_loaded": data.get("storage_loaded", False),
                 "description": f"Requires at least {MIN_DATA_HOURS}h of data",
             }
         # Storage not yet loaded - return loading state
-        return {
-            "data_hours": 0,
-            "min_hours_required": MIN_DATA_HOURS,
-            "samples_count": 0,
-            "storage_loaded": False,
-            "description": "Loading data...",
-        }
+        return _DATA_LOADING_ATTRS
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -49,99 +50,170 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Heat source type selector options (new types only, legacy types handled via migration)
+_HEAT_SOURCE_OPTIONS = [
+    selector.SelectOptionDict(value=HEAT_SOURCE_ELECTRIC, label="Electric (radiator, convector)"),
+    selector.SelectOptionDict(value=HEAT_SOURCE_HEATPUMP, label="Heat Pump (air/water)"),
+    selector.SelectOptionDict(value=HEAT_SOURCE_GAS_BOILER, label="Gas Boiler (water heating)"),
+    selector.SelectOptionDict(value=HEAT_SOURCE_GAS_FURNACE, label="Gas Furnace (forced air)"),
+]
+
+# Selectors never change between renders: build them once and share them
+_ZONE_NAME_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT))
+_TEMPERATURE_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
+)
+_HEATING_ENTITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["climate", "switch", "input_boolean", "binary_sensor"])
+)
+_HEAT_SOURCE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=_HEAT_SOURCE_OPTIONS,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_HEATER_POWER_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=100000, step=50, unit_of_measurement="W", mode="box")
+)
+_EFFICIENCY_FACTOR_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0.5, max=6.0, step=0.05, mode="box")
+)
+_SURFACE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=500, step=0.5, unit_of_measurement="m²", mode="box")
+)
+_VOLUME_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=1500, step=0.5, unit_of_measurement="m³", mode="box")
+)
+_POWER_SENSOR_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor", device_class="power"))
+_POWER_THRESHOLD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=1000, step=1, unit_of_measurement="W", mode="box")
+)
+_ENERGY_SENSOR_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor", device_class="energy"))
+_WINDOW_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="binary_sensor", device_class=["window", "door", "opening"])
+)
+_WEATHER_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="weather"))
+_ORIENTATION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=ORIENTATIONS,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+        translation_key="room_orientation",
+    )
+)
+_NOTIFY_DEVICE_SELECTOR = selector.DeviceSelector(
+    selector.DeviceSelectorConfig(filter=selector.DeviceFilterSelectorConfig(integration="mobile_app"))
+)
+_NOTIFICATION_DELAY_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=30, step=1, unit_of_measurement="min", mode="slider")
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+
+
+# Entity fields checked for existence in each step
+_ZONE_ENTITY_FIELDS = (CONF_INDOOR_TEMP_SENSOR, CONF_OUTDOOR_TEMP_SENSOR, CONF_HEATING_ENTITY)
+_DIMENSIONS_ENTITY_FIELDS = (CONF_ENERGY_SENSOR, CONF_POWER_SENSOR)
+_OPTIONS_ENTITY_FIELDS = (CONF_POWER_SENSOR, CONF_ENERGY_SENSOR, CONF_WINDOW_SENSOR)
+
+
+def _validate_entities(
+    hass: HomeAssistant,
+    user_input: dict[str, Any],
+    fields: tuple[str, ...],
+    errors: dict[str, str],
+    required: bool = False,
+) -> None:
+    """Flag fields whose entity does not exist.
+
+    Optional fields are only checked when a value was provided.
+    """
+    states_get = hass.states.get
+    for key in fields:
+        entity_id = user_input.get(key)
+        if (required or entity_id) and not states_get(entity_id):
+            errors[key] = "entity_not_found"
+
+
+@lru_cache(maxsize=256)
+def _zone_slug(zone_name: str) -> str:
+    """Return the (cached) slug used to compare zone names."""
+    return slugify(zone_name, separator="_")
+
+
+def _optional(key: str, value: Any) -> vol.Optional:
+    """Return an Optional marker with a default only when a value is set.
 
-def get_last_outdoor_temp_sensor(hass: HomeAssistant) -> str | None:
-    """Get outdoor temp sensor from existing zones (for pre-filling)."""
+    Selectors don't accept None as a default, so the default is omitted instead.
+    """
+    if value is not None:
+        return vol.Optional(key, default=value)
+    return vol.Optional(key)
+
+
+def get_last_shared_defaults(hass: HomeAssistant) -> tuple[str | None, str | None]:
+    """Get outdoor temp sensor and weather entity from existing zones (for pre-filling).
+
+    Single pass over the config entries, stopping as soon as both are found.
+    """
+    outdoor_sensor: str | None = None
+    weather: str | None = None
     for entry in hass.config_entries.async_entries(DOMAIN):
-        outdoor_sensor = entry.data.get(CONF_OUTDOOR_TEMP_SENSOR)
-        if outdoor_sensor:
-            return outdoor_sensor
-    return None
+        data = entry.data
+        if not outdoor_sensor:
+            outdoor_sensor = data.get(CONF_OUTDOOR_TEMP_SENSOR)
+        if not weather:
+            # Check in options first, then data
+            weather = entry.options.get(CONF_WEATHER_ENTITY) or data.get(CONF_WEATHER_ENTITY)
+        if outdoor_sensor and weather:
+            break
+    return outdoor_sensor or None, weather or None
 
 
 def get_last_weather_entity(hass: HomeAssistant) -> str | None:
     """Get weather entity from existing zones (for pre-filling)."""
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        # Check in options first, then data
-        weather = entry.options.get(CONF_WEATHER_ENTITY) or entry.data.get(CONF_WEATHER_ENTITY)
-        if weather:
-            return weather
-    return None
+    return get_last_shared_defaults(hass)[1]
 
 
 def get_schema_step_zone(
-    hass: HomeAssistant,
     default_outdoor: str | None = None,
     heat_source_type: str = HEAT_SOURCE_ELECTRIC,
 ) -> vol.Schema:
     """Return schema for zone configuration step."""
+    return _build_schema_step_zone(default_outdoor or None, heat_source_type)
+
+
+@lru_cache(maxsize=16)
+def _build_schema_step_zone(default_outdoor: str | None, heat_source_type: str) -> vol.Schema:
+    """Build (and cache) the zone step schema for a given outdoor default and heat source."""
     # Build outdoor temp field with or without default
     if default_outdoor:
         outdoor_field = vol.Required(CONF_OUTDOOR_TEMP_SENSOR, default=default_outdoor)
     else:
         outdoor_field = vol.Required(CONF_OUTDOOR_TEMP_SENSOR)
 
-    # Heat source type selector (new types only, legacy types handled via migration)
-    heat_source_options = [
-        selector.SelectOptionDict(value=HEAT_SOURCE_ELECTRIC, label="Electric (radiator, convector)"),
-        selector.SelectOptionDict(value=HEAT_SOURCE_HEATPUMP, label="Heat Pump (air/water)"),
-        selector.SelectOptionDict(value=HEAT_SOURCE_GAS_BOILER, label="Gas Boiler (water heating)"),
-        selector.SelectOptionDict(value=HEAT_SOURCE_GAS_FURNACE, label="Gas Furnace (forced air)"),
-    ]
-
     # Get default efficiency factor for the heat source type
     default_efficiency = DEFAULT_EFFICIENCY_FACTORS.get(heat_source_type, 1.0)
 
     schema_dict = {
-        vol.Required(CONF_ZONE_NAME): selector.TextSelector(
-            selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-        ),
-        vol.Required(CONF_INDOOR_TEMP_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
-        ),
-        outdoor_field: selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
-        ),
-        vol.Required(CONF_HEATING_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=["climate", "switch", "input_boolean", "binary_sensor"])
-        ),
-        vol.Required(CONF_HEAT_SOURCE_TYPE, default=DEFAULT_HEAT_SOURCE_TYPE): selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=heat_source_options,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        ),
+        vol.Required(CONF_ZONE_NAME): _ZONE_NAME_SELECTOR,
+        vol.Required(CONF_INDOOR_TEMP_SENSOR): _TEMPERATURE_SENSOR_SELECTOR,
+        outdoor_field: _TEMPERATURE_SENSOR_SELECTOR,
+        vol.Required(CONF_HEATING_ENTITY): _HEATING_ENTITY_SELECTOR,
+        vol.Required(CONF_HEAT_SOURCE_TYPE, default=DEFAULT_HEAT_SOURCE_TYPE): _HEAT_SOURCE_SELECTOR,
     }
 
     # Heater power: always Optional in the schema because HA config flows
     # cannot dynamically update the schema when the user changes the heat
     # source dropdown. Backend validation (in async_step_user) enforces
     # that the value is provided for electric heat sources.
-    schema_dict[vol.Optional(CONF_HEATER_POWER)] = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0,
-            max=100000,
-            step=50,
-            unit_of_measurement="W",
-            mode="box",
-        )
-    )
+    schema_dict[vol.Optional(CONF_HEATER_POWER)] = _HEATER_POWER_SELECTOR
 
     # Efficiency factor with default based on heat source type
-    schema_dict[vol.Optional(CONF_EFFICIENCY_FACTOR, default=default_efficiency)] = selector.NumberSelector(
-        selector.NumberSelectorConfig(
-            min=0.5,
-            max=6.0,
-            step=0.05,
-            mode="box",
-        )
-    )
+    schema_dict[vol.Optional(CONF_EFFICIENCY_FACTOR, default=default_efficiency)] = _EFFICIENCY_FACTOR_SELECTOR
 
     return vol.Schema(schema_dict)
 
 
 def get_schema_step_dimensions(
-    hass: HomeAssistant,
     heat_source_type: str = HEAT_SOURCE_ELECTRIC,
     default_weather: str | None = None,
 ) -> vol.Schema:
@@ -153,93 +225,48 @@ def get_schema_step_dimensions(
     """
     # Energy sensor: required for non-electric sources, optional for electric
     requires_energy = heat_source_type in HEAT_SOURCES_REQUIRING_ENERGY
+    return _build_schema_step_dimensions(requires_energy, default_weather or None)
 
-    # Build weather entity field with or without default
-    if default_weather:
-        weather_field = vol.Optional(CONF_WEATHER_ENTITY, default=default_weather)
-    else:
-        weather_field = vol.Optional(CONF_WEATHER_ENTITY)
 
+@lru_cache(maxsize=16)
+def _build_schema_step_dimensions(requires_energy: bool, default_weather: str | None) -> vol.Schema:
+    """Build (and cache) the dimensions step schema."""
     schema_dict: dict[Any, Any] = {
-        vol.Optional(CONF_SURFACE): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=1,
-                max=500,
-                step=0.5,
-                unit_of_measurement="m²",
-                mode="box",
-            )
-        ),
-        vol.Optional(CONF_VOLUME): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=1,
-                max=1500,
-                step=0.5,
-                unit_of_measurement="m³",
-                mode="box",
-            )
-        ),
-        vol.Optional(CONF_POWER_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(
-                domain="sensor",
-                device_class="power",
-            )
-        ),
-        vol.Optional(CONF_POWER_THRESHOLD, default=DEFAULT_POWER_THRESHOLD): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=1,
-                max=1000,
-                step=1,
-                unit_of_measurement="W",
-                mode="box",
-            )
-        ),
+        vol.Optional(CONF_SURFACE): _SURFACE_SELECTOR,
+        vol.Optional(CONF_VOLUME): _VOLUME_SELECTOR,
+        vol.Optional(CONF_POWER_SENSOR): _POWER_SENSOR_SELECTOR,
+        vol.Optional(CONF_POWER_THRESHOLD, default=DEFAULT_POWER_THRESHOLD): _POWER_THRESHOLD_SELECTOR,
     }
 
     # Energy sensor field: required for non-electric, optional for electric
+    # (always optional but recommended for best accuracy)
     if requires_energy:
-        schema_dict[vol.Required(CONF_ENERGY_SENSOR)] = selector.EntitySelector(
-            selector.EntitySelectorConfig(
-                domain="sensor",
-                device_class="energy",
-            )
-        )
+        schema_dict[vol.Required(CONF_ENERGY_SENSOR)] = _ENERGY_SENSOR_SELECTOR
     else:
-        # Energy sensor is always optional but recommended for best accuracy
-        schema_dict[vol.Optional(CONF_ENERGY_SENSOR)] = selector.EntitySelector(
-            selector.EntitySelectorConfig(
-                domain="sensor",
-                device_class="energy",
-            )
-        )
+        schema_dict[vol.Optional(CONF_ENERGY_SENSOR)] = _ENERGY_SENSOR_SELECTOR
 
     # Window sensor (optional)
-    schema_dict[vol.Optional(CONF_WINDOW_SENSOR)] = selector.EntitySelector(
-        selector.EntitySelectorConfig(
-            domain="binary_sensor",
-            device_class=["window", "door", "opening"],
-        )
-    )
+    schema_dict[vol.Optional(CONF_WINDOW_SENSOR)] = _WINDOW_SENSOR_SELECTOR
 
     # Weather entity (optional)
-    schema_dict[weather_field] = selector.EntitySelector(
-        selector.EntitySelectorConfig(
-            domain="weather",
-        )
-    )
+    schema_dict[_optional(CONF_WEATHER_ENTITY, default_weather)] = _WEATHER_SELECTOR
 
     # Room orientation (optional)
-    schema_dict[vol.Optional(CONF_ROOM_ORIENTATION)] = selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=ORIENTATIONS,
-            mode=selector.SelectSelectorMode.DROPDOWN,
-            translation_key="room_orientation",
-        )
-    )
+    schema_dict[vol.Optional(CONF_ROOM_ORIENTATION)] = _ORIENTATION_SELECTOR
 
     return vol.Schema(schema_dict)
 
 
+@lru_cache(maxsize=2)
+def _build_schema_heatpump_options(dynamic_cop_enabled: bool) -> vol.Schema:
+    """Build (and cache) the heat pump options schema."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_ENABLE_DYNAMIC_COP, default=dynamic_cop_enabled): _BOOLEAN_SELECTOR,
+        }
+    )
+
+
 class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Home Performance."""
 
@@ -248,6 +275,13 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
+        self._shared_defaults: tuple[str | None, str | None] | None = None
+
+    def _get_shared_defaults(self) -> tuple[str | None, str | None]:
+        """Return (outdoor sensor, weather entity) from existing zones, looked up once per flow."""
+        if self._shared_defaults is None:
+            self._shared_defaults = get_last_shared_defaults(self.hass)
+        return self._shared_defaults
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step - zone configuration."""
@@ -255,17 +289,7 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Validate that sensors exist and are available
-            indoor_temp = user_input.get(CONF_INDOOR_TEMP_SENSOR)
-            outdoor_temp = user_input.get(CONF_OUTDOOR_TEMP_SENSOR)
-            heating = user_input.get(CONF_HEATING_ENTITY)
-
-            # Check if entities exist
-            if not self.hass.states.get(indoor_temp):
-                errors[CONF_INDOOR_TEMP_SENSOR] = "entity_not_found"
-            if not self.hass.states.get(outdoor_temp):
-                errors[CONF_OUTDOOR_TEMP_SENSOR] = "entity_not_found"
-            if not self.hass.states.get(heating):
-                errors[CONF_HEATING_ENTITY] = "entity_not_found"
+            _validate_entities(self.hass, user_input, _ZONE_ENTITY_FIELDS, errors, required=True)
 
             # Get heat source type (default to electric for backward compat)
             heat_source_type = user_input.get(CONF_HEAT_SOURCE_TYPE, HEAT_SOURCE_ELECTRIC)
@@ -284,20 +308,19 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input[CONF_HEATER_POWER] = None
 
             # Check if zone name is already used (use slugify for consistent comparison)
-            zone_name = user_input.get(CONF_ZONE_NAME, "").strip()
-            zone_slug = slugify(zone_name, separator="_")
-            for entry in self.hass.config_entries.async_entries(DOMAIN):
-                existing_name = entry.data.get(CONF_ZONE_NAME, "")
-                if slugify(existing_name, separator="_") == zone_slug:
+            # (skipped entirely when this is the first zone)
+            if entries := self.hass.config_entries.async_entries(DOMAIN):
+                zone_name = user_input.get(CONF_ZONE_NAME, "").strip()
+                existing_slugs = {_zone_slug(entry.data.get(CONF_ZONE_NAME, "")) for entry in entries}
+                if _zone_slug(zone_name) in existing_slugs:
                     errors[CONF_ZONE_NAME] = "already_configured"
-                    break
 
             if not errors:
                 self._data.update(user_input)
                 return await self.async_step_dimensions()
 
         # Get outdoor temp sensor from existing zones (for pre-filling)
-        default_outdoor = get_last_outdoor_temp_sensor(self.hass)
+        default_outdoor = self._get_shared_defaults()[0]
 
         # Get heat source type for re-display after error:
         # prefer user_input (what the user just selected) over stored data
@@ -308,7 +331,7 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=get_schema_step_zone(self.hass, default_outdoor, current_heat_source),
+            data_schema=get_schema_step_zone(default_outdoor, current_heat_source),
             errors=errors,
             description_placeholders={"name": "Home Performance"},
         )
@@ -319,22 +342,15 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         heat_source_type = self._data.get(CONF_HEAT_SOURCE_TYPE, HEAT_SOURCE_ELECTRIC)
 
         if user_input is not None:
-            # Validate energy sensor if provided (optional for all heat sources)
-            energy_sensor = user_input.get(CONF_ENERGY_SENSOR)
-            if energy_sensor and not self.hass.states.get(energy_sensor):
-                errors[CONF_ENERGY_SENSOR] = "entity_not_found"
-
-            # Validate power sensor if provided
-            power_sensor = user_input.get(CONF_POWER_SENSOR)
-            if power_sensor and not self.hass.states.get(power_sensor):
-                errors[CONF_POWER_SENSOR] = "entity_not_found"
+            # Validate energy and power sensors if provided (optional for all heat sources)
+            _validate_entities(self.hass, user_input, _DIMENSIONS_ENTITY_FIELDS, errors)
 
             if not errors:
                 self._data.update(user_input)
 
                 # Create unique ID based on zone name (use slugify for special characters)
                 zone_name = self._data[CONF_ZONE_NAME]
-                zone_slug = slugify(zone_name, separator="_")
+                zone_slug = _zone_slug(zone_name)
                 await self.async_set_unique_id(f"home_performance_{zone_slug}")
                 self._abort_if_unique_id_configured()
 
@@ -344,11 +360,11 @@ class HomePerformanceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
 
         # Get weather entity from existing zones (for pre-filling)
-        default_weather = get_last_weather_entity(self.hass)
+        default_weather = self._get_shared_defaults()[1]
 
         return self.async_show_form(
             step_id="dimensions",
-            data_schema=get_schema_step_dimensions(self.hass, heat_source_type, default_weather),
+            data_schema=get_schema_step_dimensions(heat_source_type, default_weather),
             errors=errors,
         )
 
@@ -368,13 +384,17 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self._config_entry = config_entry
         self._data: dict[str, Any] = {}
+        # Entry is not modified while the flow is open, merge data and options once
+        self._current: dict[str, Any] = {**config_entry.data, **config_entry.options}
+        # Keys that currently hold a value (clearing one of them must be stored explicitly)
+        self._previously_set: frozenset[str] = frozenset(k for k, v in self._current.items() if v is not None)
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage the options - Step 1: General options."""
         errors: dict[str, str] = {}
 
         # Get current values from data or options
-        current = {**self._config_entry.data, **self._config_entry.options}
+        current = self._current
         heat_source_type = current.get(CONF_HEAT_SOURCE_TYPE, HEAT_SOURCE_ELECTRIC)
 
         if user_input is not None:
@@ -387,20 +407,8 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
                 if not heater_power or heater_power <= 0:
                     errors[CONF_HEATER_POWER] = "invalid_power"
 
-            # Validate power sensor if provided
-            power_sensor = user_input.get(CONF_POWER_SENSOR)
-            if power_sensor and not self.hass.states.get(power_sensor):
-                errors[CONF_POWER_SENSOR] = "entity_not_found"
-
-            # Validate energy sensor if provided (optional for all heat sources)
-            energy_sensor = user_input.get(CONF_ENERGY_SENSOR)
-            if energy_sensor and not self.hass.states.get(energy_sensor):
-                errors[CONF_ENERGY_SENSOR] = "entity_not_found"
-
-            # Validate window sensor if provided
-            window_sensor = user_input.get(CONF_WINDOW_SENSOR)
-            if window_sensor and not self.hass.states.get(window_sensor):
-                errors[CONF_WINDOW_SENSOR] = "entity_not_found"
+            # Validate power, energy and window sensors if provided
+            _validate_entities(self.hass, user_input, _OPTIONS_ENTITY_FIELDS, errors)
 
             if not errors:
                 # Store data for potential step 2
@@ -411,7 +419,7 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
                     return await self.async_step_heatpump_options()
 
                 # Otherwise, finalize directly
-                return self._create_entry(current)
+                return self._create_entry()
 
         # Migrate legacy heat source types to new ones for display
         # (the actual migration happens in coordinator on load)
@@ -419,229 +427,66 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
         if heat_source_type in HEAT_SOURCE_MIGRATION:
             display_heat_source = HEAT_SOURCE_MIGRATION[heat_source_type]
 
-        # Heat source type selector (new types only)
-        heat_source_options = [
-            selector.SelectOptionDict(value=HEAT_SOURCE_ELECTRIC, label="Electric (radiator, convector)"),
-            selector.SelectOptionDict(value=HEAT_SOURCE_HEATPUMP, label="Heat Pump (air/water)"),
-            selector.SelectOptionDict(value=HEAT_SOURCE_GAS_BOILER, label="Gas Boiler (water heating)"),
-            selector.SelectOptionDict(value=HEAT_SOURCE_GAS_FURNACE, label="Gas Furnace (forced air)"),
-        ]
-
-        # Build schema dynamically
-        schema_dict: dict[Any, Any] = {
-            vol.Required(
-                CONF_HEAT_SOURCE_TYPE,
-                default=display_heat_source,
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=heat_source_options,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        }
-
         # Heater power - always Optional in schema (backend validates for electric)
         heater_power_value = current.get(CONF_HEATER_POWER)
-        if heater_power_value is not None and heater_power_value > 0:
-            schema_dict[vol.Optional(CONF_HEATER_POWER, default=heater_power_value)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=0, max=100000, step=50, unit_of_measurement="W", mode="box")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_HEATER_POWER)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=0, max=100000, step=50, unit_of_measurement="W", mode="box")
-            )
-
-        # Surface - only set default if value exists (NumberSelector doesn't support None)
-        surface_value = current.get(CONF_SURFACE)
-        if surface_value is not None:
-            schema_dict[vol.Optional(CONF_SURFACE, default=surface_value)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=500, step=0.5, unit_of_measurement="m²", mode="box")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_SURFACE)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=500, step=0.5, unit_of_measurement="m²", mode="box")
-            )
-
-        # Volume - only set default if value exists
-        volume_value = current.get(CONF_VOLUME)
-        if volume_value is not None:
-            schema_dict[vol.Optional(CONF_VOLUME, default=volume_value)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=1500, step=0.5, unit_of_measurement="m³", mode="box")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_VOLUME)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=1500, step=0.5, unit_of_measurement="m³", mode="box")
-            )
-
-        # Power sensor - only set default if value exists (EntitySelector doesn't handle None)
-        power_sensor_value = current.get(CONF_POWER_SENSOR) or None
-        if power_sensor_value is not None:
-            schema_dict[vol.Optional(CONF_POWER_SENSOR, default=power_sensor_value)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class="power",
-                )
-            )
-        else:
-            schema_dict[vol.Optional(CONF_POWER_SENSOR)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class="power",
-                )
-            )
-
-        # Power threshold - always show with default
-        power_threshold_value = current.get(CONF_POWER_THRESHOLD, DEFAULT_POWER_THRESHOLD)
-        schema_dict[vol.Optional(CONF_POWER_THRESHOLD, default=power_threshold_value)] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=1,
-                max=1000,
-                step=1,
-                unit_of_measurement="W",
-                mode="box",
-            )
-        )
+        if heater_power_value is not None and heater_power_value <= 0:
+            heater_power_value = None
 
-        # === ENERGY CONFIGURATION GROUP ===
         # Energy sensor - required for non-electric sources, optional for electric
         energy_sensor_value = current.get(CONF_ENERGY_SENSOR) or None
         if heat_source_type in HEAT_SOURCES_REQUIRING_ENERGY:
-            schema_dict[
-                vol.Required(
-                    CONF_ENERGY_SENSOR,
-                    default=energy_sensor_value,
-                )
-            ] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class="energy",
-                )
-            )
-        elif energy_sensor_value is not None:
-            schema_dict[vol.Optional(CONF_ENERGY_SENSOR, default=energy_sensor_value)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class="energy",
-                )
-            )
+            energy_sensor_key = vol.Required(CONF_ENERGY_SENSOR, default=energy_sensor_value)
         else:
-            schema_dict[vol.Optional(CONF_ENERGY_SENSOR)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class="energy",
-                )
-            )
+            energy_sensor_key = _optional(CONF_ENERGY_SENSOR, energy_sensor_value)
 
-        # Efficiency factor - right after energy sensor for UX clarity
+        # Efficiency factor - default for the heat source type when not set
         efficiency_value = current.get(CONF_EFFICIENCY_FACTOR)
         if efficiency_value is None:
-            # Use default for the heat source type
             efficiency_value = DEFAULT_EFFICIENCY_FACTORS.get(display_heat_source, 1.0)
-        schema_dict[vol.Optional(CONF_EFFICIENCY_FACTOR, default=efficiency_value)] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0.5,
-                max=6.0,
-                step=0.05,
-                mode="box",
-            )
-        )
-
-        # Note: enable_dynamic_cop is shown in step 2 only for heat pumps
-
-        # Window sensor - only set default if value exists
-        window_sensor_value = current.get(CONF_WINDOW_SENSOR) or None
-        if window_sensor_value is not None:
-            schema_dict[vol.Optional(CONF_WINDOW_SENSOR, default=window_sensor_value)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="binary_sensor",
-                    device_class=["window", "door", "opening"],
-                )
-            )
-        else:
-            schema_dict[vol.Optional(CONF_WINDOW_SENSOR)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="binary_sensor",
-                    device_class=["window", "door", "opening"],
-                )
-            )
-
-        # === NOTIFICATION OPTIONS ===
-        # Enable window notifications
-        notification_enabled = current.get(CONF_WINDOW_NOTIFICATION_ENABLED, False)
-        schema_dict[vol.Optional(CONF_WINDOW_NOTIFICATION_ENABLED, default=notification_enabled)] = (
-            selector.BooleanSelector()
-        )
-
-        # Notify device - only show if notifications are or will be enabled
-        notify_device_value = current.get(CONF_NOTIFY_DEVICE) or None
-        if notify_device_value is not None:
-            schema_dict[vol.Optional(CONF_NOTIFY_DEVICE, default=notify_device_value)] = selector.DeviceSelector(
-                selector.DeviceSelectorConfig(filter=selector.DeviceFilterSelectorConfig(integration="mobile_app"))
-            )
-        else:
-            schema_dict[vol.Optional(CONF_NOTIFY_DEVICE)] = selector.DeviceSelector(
-                selector.DeviceSelectorConfig(filter=selector.DeviceFilterSelectorConfig(integration="mobile_app"))
-            )
-
-        # Notification delay
-        notification_delay = current.get(CONF_NOTIFICATION_DELAY, DEFAULT_NOTIFICATION_DELAY)
-        schema_dict[vol.Optional(CONF_NOTIFICATION_DELAY, default=notification_delay)] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0,
-                max=30,
-                step=1,
-                unit_of_measurement="min",
-                mode="slider",
-            )
-        )
 
-        # === WEATHER OPTIONS ===
         # Weather entity - shared between zones, pre-fill from other zones if not set
         weather_entity_value = current.get(CONF_WEATHER_ENTITY)
         if not weather_entity_value:
             weather_entity_value = get_last_weather_entity(self.hass)
-        if weather_entity_value is not None:
-            schema_dict[vol.Optional(CONF_WEATHER_ENTITY, default=weather_entity_value)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="weather")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_WEATHER_ENTITY)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="weather")
-            )
 
         # Room orientation
         # Normalize to lowercase for case-insensitive matching with ORIENTATIONS (legacy data fix)
         room_orientation_value = current.get(CONF_ROOM_ORIENTATION)
         if room_orientation_value is not None:
             room_orientation_value = room_orientation_value.lower()
-            # Only use as default if it's a valid orientation
-            if room_orientation_value in ORIENTATIONS:
-                schema_dict[vol.Optional(CONF_ROOM_ORIENTATION, default=room_orientation_value)] = (
-                    selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=ORIENTATIONS,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                            translation_key="room_orientation",
-                        )
-                    )
-                )
-            else:
-                # Invalid legacy value, show empty selector
-                schema_dict[vol.Optional(CONF_ROOM_ORIENTATION)] = selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=ORIENTATIONS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                        translation_key="room_orientation",
-                    )
-                )
-        else:
-            schema_dict[vol.Optional(CONF_ROOM_ORIENTATION)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=ORIENTATIONS,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                    translation_key="room_orientation",
-                )
-            )
+        # Only use as default if it's a valid orientation (invalid legacy value: empty selector)
+        if room_orientation_value not in ORIENTATIONS:
+            room_orientation_value = None
+
+        # Optional fields only get a default if a value exists
+        # (NumberSelector/EntitySelector don't handle a None default)
+        # Note: enable_dynamic_cop is shown in step 2 only for heat pumps
+        schema_dict: dict[Any, Any] = {
+            vol.Required(CONF_HEAT_SOURCE_TYPE, default=display_heat_source): _HEAT_SOURCE_SELECTOR,
+            _optional(CONF_HEATER_POWER, heater_power_value): _HEATER_POWER_SELECTOR,
+            _optional(CONF_SURFACE, current.get(CONF_SURFACE)): _SURFACE_SELECTOR,
+            _optional(CONF_VOLUME, current.get(CONF_VOLUME)): _VOLUME_SELECTOR,
+            _optional(CONF_POWER_SENSOR, current.get(CONF_POWER_SENSOR) or None): _POWER_SENSOR_SELECTOR,
+            vol.Optional(
+                CONF_POWER_THRESHOLD, default=current.get(CONF_POWER_THRESHOLD, DEFAULT_POWER_THRESHOLD)
+            ): _POWER_THRESHOLD_SELECTOR,
+            # === ENERGY CONFIGURATION GROUP ===
+            energy_sensor_key: _ENERGY_SENSOR_SELECTOR,
+            # Efficiency factor - right after energy sensor for UX clarity
+            vol.Optional(CONF_EFFICIENCY_FACTOR, default=efficiency_value): _EFFICIENCY_FACTOR_SELECTOR,
+            _optional(CONF_WINDOW_SENSOR, current.get(CONF_WINDOW_SENSOR) or None): _WINDOW_SENSOR_SELECTOR,
+            # === NOTIFICATION OPTIONS ===
+            vol.Optional(
+                CONF_WINDOW_NOTIFICATION_ENABLED, default=current.get(CONF_WINDOW_NOTIFICATION_ENABLED, False)
+            ): _BOOLEAN_SELECTOR,
+            _optional(CONF_NOTIFY_DEVICE, current.get(CONF_NOTIFY_DEVICE) or None): _NOTIFY_DEVICE_SELECTOR,
+            vol.Optional(
+                CONF_NOTIFICATION_DELAY, default=current.get(CONF_NOTIFICATION_DELAY, DEFAULT_NOTIFICATION_DELAY)
+            ): _NOTIFICATION_DELAY_SELECTOR,
+            # === WEATHER OPTIONS ===
+            _optional(CONF_WEATHER_ENTITY, weather_entity_value): _WEATHER_SELECTOR,
+            _optional(CONF_ROOM_ORIENTATION, room_orientation_value): _ORIENTATION_SELECTOR,
+        }
 
         return self.async_show_form(
             step_id="init",
@@ -651,27 +496,19 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_heatpump_options(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Step 2: Heat pump specific options (dynamic COP)."""
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         if user_input is not None:
             # Merge heat pump options into collected data
             self._data.update(user_input)
-            return self._create_entry(current)
-
-        # Build schema for heat pump options
-        dynamic_cop_enabled = current.get(CONF_ENABLE_DYNAMIC_COP, DEFAULT_ENABLE_DYNAMIC_COP)
-        schema = vol.Schema(
-            {
-                vol.Optional(CONF_ENABLE_DYNAMIC_COP, default=dynamic_cop_enabled): selector.BooleanSelector(),
-            }
-        )
+            return self._create_entry()
+
+        dynamic_cop_enabled = self._current.get(CONF_ENABLE_DYNAMIC_COP, DEFAULT_ENABLE_DYNAMIC_COP)
 
         return self.async_show_form(
             step_id="heatpump_options",
-            data_schema=schema,
+            data_schema=_build_schema_heatpump_options(bool(dynamic_cop_enabled)),
         )
 
-    def _create_entry(self, current: dict[str, Any]) -> FlowResult:
+    def _create_entry(self) -> FlowResult:
         """Create the config entry with collected data."""
         # Entity/device selector fields that return "" when cleared by the user
         _ENTITY_SELECTOR_FIELDS = {
@@ -695,7 +532,7 @@ class HomePerformanceOptionsFlow(config_entries.OptionsFlow):
                 v = None
             if v is not None:
                 cleaned_input[k] = v
-            elif k in current and current[k] is not None:
+            elif k in self._previously_set:
                 # User cleared a previously set value - explicitly set to None
                 # This allows removing a power_sensor or energy_sensor
                 cleaned_input[k] = None
@@ -73,11 +73,13 @@ HEAT_SOURCE_TYPES = [
 
 # Heat sources that benefit from an energy sensor (for more accurate K calculation)
 # Note: energy_sensor is always optional but recommended for non-electric sources
-HEAT_SOURCES_REQUIRING_ENERGY = [
-    HEAT_SOURCE_HEATPUMP,
-    HEAT_SOURCE_GAS_BOILER,
-    HEAT_SOURCE_GAS_FURNACE,
-]
+HEAT_SOURCES_REQUIRING_ENERGY: Final[frozenset[str]] = frozenset(
+    {
+        HEAT_SOURCE_HEATPUMP,
+        HEAT_SOURCE_GAS_BOILER,
+        HEAT_SOURCE_GAS_FURNACE,
+    }
+)
 
 # Efficiency factor configuration
 CONF_EFFICIENCY_FACTOR = "efficiency_factor"  # Multiplier: electric consumption → heat output
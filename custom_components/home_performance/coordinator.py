@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
-from datetime import timedelta
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfTemperature
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -56,23 +56,67 @@ from .models import ThermalDataPoint, ThermalLossModel
 
 _LOGGER = logging.getLogger(__name__)
 
+HomePerformanceConfigEntry = ConfigEntry["HomePerformanceCoordinator"]
+
+# Sensor states that carry no value
+UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
 # Storage version and save interval
 STORAGE_VERSION = 1
 SAVE_INTERVAL_SECONDS = 300  # Save every 5 minutes
 
+# Scalar values persisted as-is, each stored in the coordinator attribute "_<key>"
+# Note: energy_sensor_daily_kwh is read directly from the sensor, not stored
+PERSISTED_SCALARS = (
+    "measured_energy_total_kwh",
+    "measured_energy_daily_kwh",
+    "last_daily_reset_date",
+    "last_indoor_temp",
+    "last_heating_state",
+    "last_power_value",
+    # Daily counters (minuit-minuit)
+    "estimated_energy_daily_kwh",
+    "heating_seconds_daily",
+    "delta_t_sum_daily",
+    "delta_t_count_daily",
+)
+
+# Real-time window detection thresholds (in °C/min)
+# - 0.7°C/min while heating (was 0.5, more tolerant for fast-cycling systems)
+# - 1.2°C/min regardless (was 1.0, accounts for natural cooling after furnace off)
+WINDOW_DROP_THRESHOLD_HEATING = -0.7
+WINDOW_DROP_THRESHOLD_ANY = -1.2
+WINDOW_CONSECUTIVE_DROPS_REQUIRED = 2  # Need 2+ consecutive readings to confirm
+
+# Compass directions in 45° sectors, clockwise from north (index = sector)
+WIND_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+# Sector index for each whole-degree bearing (0-359), N covering 338°-22°
+WIND_SECTOR_BY_BEARING = bytes(((bearing + 22) % 360) // 45 for bearing in range(360))
+# Sector index by lowercase direction name (wind direction or room orientation)
+DIRECTION_INDEX = {direction.lower(): index for index, direction in enumerate(WIND_DIRECTIONS)}
+
+# Window open notification message by language prefix (English default)
+WINDOW_NOTIFICATION_MESSAGES = {
+    "fr": "Fenêtre ouverte · Chauffage actif",
+    "it": "Finestra aperta · Riscaldamento attivo",
+}
+WINDOW_NOTIFICATION_MESSAGE_DEFAULT = "Window open · Heating active"
+
 
 class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage home performance data for a single zone."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
-        self.entry = entry
+    config_entry: HomePerformanceConfigEntry
 
+    def __init__(self, hass: HomeAssistant, config_entry: HomePerformanceConfigEntry) -> None:
+        """Initialize the coordinator."""
         # Merge data and options (options override data)
-        config = {**entry.data, **entry.options}
+        config = {**config_entry.data, **config_entry.options}
 
         # Zone configuration
         self.zone_name: str = config[CONF_ZONE_NAME]
+        # Use slugify for consistent handling of special characters (ü, é, ç, etc.)
+        self.zone_slug: str = slugify(self.zone_name, separator="_")
         self.indoor_temp_sensor: str = config[CONF_INDOOR_TEMP_SENSOR]
         self.outdoor_temp_sensor: str = config[CONF_OUTDOOR_TEMP_SENSOR]
         self.heating_entity: str = config[CONF_HEATING_ENTITY]
@@ -86,6 +130,10 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
         self.heater_power: float | None = config.get(CONF_HEATER_POWER)
+        # Estimated energy per heating second (kWh/s), 0 when no declared power
+        self._heater_kwh_per_second: float = (
+            self.heater_power / 3_600_000 if self.heater_power is not None and self.heater_power > 0 else 0.0
+        )
         self.surface: float | None = config.get(CONF_SURFACE)
         self.volume: float | None = config.get(CONF_VOLUME)
         # Normalize empty strings to None for entity fields
@@ -180,7 +228,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Daily wind tracking (for history archival)
         self._wind_speed_sum_daily: float = 0.0  # Sum of wind speed for daily average
         self._wind_speed_count_daily: int = 0  # Count of wind samples
-        self._wind_direction_counts_daily: dict[str, int] = {}  # Count per direction
+        self._wind_direction_counts_daily: Counter[str] = Counter()  # Count per direction
 
         # Real-time heating tracking (event-driven for precision)
         self._heating_start_time: float | None = None  # Timestamp when heating started
@@ -196,35 +244,45 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._consecutive_drops: int = 0  # Count of consecutive temperature drops
 
         # Notification tracking
-        self._notification_task: asyncio.Task | None = None  # Delayed notification task
+        self._notification_unsub: CALLBACK_TYPE | None = None  # Delayed notification timer cancel
         self._last_notification_time: float | None = None  # Cooldown tracking
+        self._notify_service: str | None = None  # Resolved notify service (cached)
+        self._notify_title = f"⚠️ {self.zone_name}"
+        self._notify_data = {"tag": f"home_performance_window_{self.zone_name}", "group": "home_performance"}
+        self._device_registry_unsub: CALLBACK_TYPE | None = None  # Notify device update listener unsubscribe
 
         # Dynamic COP tracking (for heat pumps)
         self._last_measured_cop: float | None = None  # Last calculated COP (for archiving)
 
-        # Persistence - use slugify for consistent handling of special characters
-        zone_slug = slugify(self.zone_name, separator="_")
+        # Persistence
         self._store = Store(
             hass,
             STORAGE_VERSION,
-            f"{DOMAIN}.{zone_slug}",
+            f"{DOMAIN}.{self.zone_slug}",
         )
-        self._last_save_time: float = 0
+        self._save_scheduled: bool = False  # A delayed save is pending in the store
         self._data_loaded: bool = False
 
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=f"{DOMAIN}_{self.zone_name}",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Data is a plain dict: skip entity writes when a refresh changes nothing
+            always_update=False,
         )
 
-    async def async_config_entry_first_refresh(self) -> None:
-        """Load persisted data before first refresh."""
+    async def _async_setup(self) -> None:
+        """Load persisted data and start real-time listeners before first refresh.
+
+        Called once by DataUpdateCoordinator during the first refresh, so sensors
+        are created with their last known values without extra startup work.
+        """
         await self._async_load_data()
         self._setup_power_listener()
         self._setup_temperature_listener()
-        await super().async_config_entry_first_refresh()
+        self._setup_notify_device_listener()
 
     def _setup_power_listener(self) -> None:
         """Set up real-time listener for power sensor changes."""
@@ -236,41 +294,39 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         def _async_power_state_changed(event: Event) -> None:
             """Handle power sensor state changes in real-time."""
             new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
 
             if new_state is None:
                 return
 
-            # Parse power values
-            try:
-                new_power = float(new_state.state) if new_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN) else 0.0
-            except (ValueError, TypeError):
+            # Parse the new power value (the previous one is not needed:
+            # transitions are detected against the real-time heating state)
+            raw_power = new_state.state
+            if raw_power in UNAVAILABLE_STATES:
                 new_power = 0.0
+            else:
+                try:
+                    new_power = float(raw_power)
+                except ValueError:  # State is always a str
+                    new_power = 0.0
 
-            try:
-                old_power = (
-                    float(old_state.state)
-                    if old_state and old_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                    else 0.0
-                )
-            except (ValueError, TypeError):
-                old_power = 0.0
+            is_heating_now = new_power > self.power_threshold
+
+            # Most updates don't cross the threshold: nothing to do
+            if is_heating_now == self._is_heating_realtime:
+                return
 
             now = time.time()
-            is_heating_now = new_power > self.power_threshold
-            was_heating = old_power > self.power_threshold
 
             _LOGGER.debug(
-                "[%s] Power sensor changed: %.1fW -> %.1fW (heating: %s -> %s)",
+                "[%s] Power sensor changed: %.1fW (heating: %s -> %s)",
                 self.zone_name,
-                old_power,
                 new_power,
-                was_heating,
+                self._is_heating_realtime,
                 is_heating_now,
             )
 
             # Heating started
-            if is_heating_now and not self._is_heating_realtime:
+            if is_heating_now:
                 self._heating_start_time = now
                 self._is_heating_realtime = True
                 _LOGGER.info("[%s] 🔥 Heating started (real-time detection)", self.zone_name)
@@ -279,13 +335,13 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self._schedule_window_notification()
 
             # Heating stopped
-            elif not is_heating_now and self._is_heating_realtime:
+            else:
                 if self._heating_start_time is not None:
                     duration = now - self._heating_start_time
                     self._heating_seconds_daily += duration
                     # Update estimated energy (only if heater_power is available)
-                    if self.heater_power is not None and self.heater_power > 0:
-                        energy_kwh = (self.heater_power / 1000) * (duration / 3600)
+                    if self._heater_kwh_per_second:
+                        energy_kwh = self._heater_kwh_per_second * duration
                         self._estimated_energy_daily_kwh += energy_kwh
                         _LOGGER.info(
                             "[%s] ❄️ Heating stopped (real-time). Duration: %.1fs (%.2f min), Energy: %.4f kWh",
@@ -322,46 +378,39 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             """Handle indoor temperature changes in real-time for window detection."""
             new_state = event.data.get("new_state")
 
-            if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if new_state is None or new_state.state in UNAVAILABLE_STATES:
                 return
 
             try:
                 new_temp = float(new_state.state)
-
-                # Convert to Celsius if needed (for consistent rate calculations)
-                unit = new_state.attributes.get("unit_of_measurement", UnitOfTemperature.CELSIUS)
-                if unit == UnitOfTemperature.FAHRENHEIT:
-                    new_temp = TemperatureConverter.convert(
-                        new_temp, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
-                    )
             except (ValueError, TypeError):
                 return
 
+            # Convert to Celsius if needed (for consistent rate calculations)
+            # Inline formula: this runs on every reading, no need for the generic converter
+            if new_state.attributes.get("unit_of_measurement") == UnitOfTemperature.FAHRENHEIT:
+                new_temp = (new_temp - 32.0) / 1.8
+
             now = time.time()
 
             # Check for rapid temperature drop (window open detection)
             # Improved algorithm to reduce false positives with fast-cycling systems (e.g., US furnaces)
-            if self._last_temp_value is not None and self._last_temp_time is not None:
-                time_delta = now - self._last_temp_time
+            last_temp = self._last_temp_value
+            last_time = self._last_temp_time
+            if last_temp is not None and last_time is not None:
+                time_delta = now - last_time
                 if time_delta > 0:
-                    temp_change = new_temp - self._last_temp_value
-                    rate_per_minute = (temp_change / time_delta) * 60
-
-                    # Thresholds (in °C/min):
-                    # - 0.7°C/min while heating (was 0.5, more tolerant for fast-cycling systems)
-                    # - 1.2°C/min regardless (was 1.0, accounts for natural cooling after furnace off)
-                    DROP_THRESHOLD_HEATING = -0.7
-                    DROP_THRESHOLD_ANY = -1.2
-                    CONSECUTIVE_DROPS_REQUIRED = 2  # Need 2+ consecutive readings to confirm
+                    rate_per_minute = ((new_temp - last_temp) / time_delta) * 60
 
                     was_window_open = self._window_open_realtime
+                    is_heating = self._is_heating_realtime
                     is_rapid_drop = (
-                        self._is_heating_realtime and rate_per_minute < DROP_THRESHOLD_HEATING
-                    ) or rate_per_minute < DROP_THRESHOLD_ANY
+                        is_heating and rate_per_minute < WINDOW_DROP_THRESHOLD_HEATING
+                    ) or rate_per_minute < WINDOW_DROP_THRESHOLD_ANY
 
                     if is_rapid_drop:
                         self._consecutive_drops += 1
-                        if self._consecutive_drops >= CONSECUTIVE_DROPS_REQUIRED:
+                        if self._consecutive_drops >= WINDOW_CONSECUTIVE_DROPS_REQUIRED:
                             if not was_window_open:
                                 self._window_open_realtime = True
                                 self._window_open_since = now
@@ -369,10 +418,10 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                                     "[%s] 🪟 Window OPEN detected! Temp drop: %.2f°C/min (heating: %s)",
                                     self.zone_name,
                                     abs(rate_per_minute),
-                                    self._is_heating_realtime,
+                                    is_heating,
                                 )
                                 # Trigger notification if heating is on and notifications enabled
-                                if self._is_heating_realtime:
+                                if is_heating:
                                     self._schedule_window_notification()
                     elif rate_per_minute > 0.1:
                         # Temperature rising = window likely closed
@@ -409,31 +458,85 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         _LOGGER.info("[%s] ✅ Real-time temperature listener set up for %s", self.zone_name, self.indoor_temp_sensor)
 
+    def _setup_notify_device_listener(self) -> None:
+        """Drop the cached notify service when the notify device changes in the registry."""
+        if not self.notify_device:
+            return
+
+        @callback
+        def _async_filter_notify_device(event_data: dict[str, Any]) -> bool:
+            """Only react to updates of the configured notify device."""
+            return event_data.get("device_id") == self.notify_device
+
+        @callback
+        def _async_notify_device_updated(event: Event) -> None:
+            """Invalidate the cached notify service."""
+            self._notify_service = None
+
+        self._device_registry_unsub = self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            _async_notify_device_updated,
+            event_filter=_async_filter_notify_device,
+        )
+
+    @callback
+    def _async_resolve_notify_service(self) -> str | None:
+        """Return the notify service name for the configured device (cached)."""
+        if self._notify_service is not None:
+            return self._notify_service
+
+        device = dr.async_get(self.hass).async_get(self.notify_device)
+        if not device:
+            _LOGGER.warning("[%s] Notify device not found: %s", self.zone_name, self.notify_device)
+            return None
+
+        # Find the mobile_app notify service for this device
+        # The service name is typically notify.mobile_app_<device_name>
+        notify_service = None
+        for identifier in device.identifiers:
+            if identifier[0] == "mobile_app":
+                # The device ID format is usually the device name
+                device_name = identifier[1].lower().replace(" ", "_").replace("-", "_")
+                notify_service = f"mobile_app_{device_name}"
+                break
+
+        if not notify_service:
+            # Fallback: try using device name directly
+            if device.name:
+                device_name = device.name.lower().replace(" ", "_").replace("-", "_")
+                notify_service = f"mobile_app_{device_name}"
+            else:
+                _LOGGER.warning("[%s] Could not determine notify service for device", self.zone_name)
+                return None
+
+        self._notify_service = notify_service
+        return notify_service
+
     def _schedule_window_notification(self) -> None:
         """Schedule a window open notification after the configured delay."""
         if not self.window_notification_enabled or not self.notify_device:
             return
 
-        # Cancel any existing notification task
-        if self._notification_task and not self._notification_task.done():
-            self._notification_task.cancel()
+        # Cancel any existing notification timer
+        if self._notification_unsub:
+            self._notification_unsub()
 
-        # Create a new notification task
-        self._notification_task = self.hass.async_create_task(self._async_send_window_notification())
+        # Send the notification after the configured delay (a timer handle, no task until it fires)
+        self._notification_unsub = async_call_later(
+            self.hass, self.notification_delay * 60, self._async_send_window_notification
+        )
 
     def _cancel_window_notification(self) -> None:
         """Cancel any pending window notification."""
-        if self._notification_task and not self._notification_task.done():
-            self._notification_task.cancel()
-            self._notification_task = None
+        if self._notification_unsub:
+            self._notification_unsub()
+            self._notification_unsub = None
             _LOGGER.debug("[%s] Window notification cancelled", self.zone_name)
 
-    async def _async_send_window_notification(self) -> None:
-        """Send window open notification after delay."""
+    async def _async_send_window_notification(self, _now: datetime) -> None:
+        """Send window open notification once the delay has elapsed."""
+        self._notification_unsub = None
         try:
-            # Wait for the configured delay
-            await asyncio.sleep(self.notification_delay * 60)
-
             # Re-check conditions after delay
             if not self._window_open_realtime or not self._is_heating_realtime:
                 _LOGGER.debug("[%s] Conditions no longer met, skipping notification", self.zone_name)
@@ -446,53 +549,22 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return
 
             # Get notify service name from device
-            device_registry = dr.async_get(self.hass)
-            device = device_registry.async_get(self.notify_device)
-
-            if not device:
-                _LOGGER.warning("[%s] Notify device not found: %s", self.zone_name, self.notify_device)
+            notify_service = self._async_resolve_notify_service()
+            if not notify_service:
                 return
 
-            # Find the mobile_app notify service for this device
-            # The service name is typically notify.mobile_app_<device_name>
-            notify_service = None
-            for identifier in device.identifiers:
-                if identifier[0] == "mobile_app":
-                    # The device ID format is usually the device name
-                    device_name = identifier[1].lower().replace(" ", "_").replace("-", "_")
-                    notify_service = f"mobile_app_{device_name}"
-                    break
-
-            if not notify_service:
-                # Fallback: try using device name directly
-                if device.name:
-                    device_name = device.name.lower().replace(" ", "_").replace("-", "_")
-                    notify_service = f"mobile_app_{device_name}"
-                else:
-                    _LOGGER.warning("[%s] Could not determine notify service for device", self.zone_name)
-                    return
-
-            # Get translated message based on HA language
-            lang = self.hass.config.language or "en"
-            title = f"⚠️ {self.zone_name}"
-            if lang.startswith("fr"):
-                message = "Fenêtre ouverte · Chauffage actif"
-            elif lang.startswith("it"):
-                message = "Finestra aperta · Riscaldamento attivo"
-            else:  # English default
-                message = "Window open · Heating active"
+            # Get translated message based on HA language (read at send time, it can change)
+            lang = (self.hass.config.language or "en")[:2]
+            message = WINDOW_NOTIFICATION_MESSAGES.get(lang, WINDOW_NOTIFICATION_MESSAGE_DEFAULT)
 
             # Send the notification
             await self.hass.services.async_call(
                 "notify",
                 notify_service,
                 {
-                    "title": title,
+                    "title": self._notify_title,
                     "message": message,
-                    "data": {
-                        "tag": f"home_performance_window_{self.zone_name}",
-                        "group": "home_performance",
-                    },
+                    "data": self._notify_data,
                 },
                 blocking=False,
             )
@@ -500,8 +572,6 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._last_notification_time = now
             _LOGGER.info("[%s] 📱 Window open notification sent", self.zone_name)
 
-        except asyncio.CancelledError:
-            _LOGGER.debug("[%s] Window notification task cancelled", self.zone_name)
         except Exception as err:
             _LOGGER.error("[%s] Failed to send window notification: %s", self.zone_name, err)
 
@@ -522,17 +592,22 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._temp_listener_unsub = None
             _LOGGER.debug("[%s] Temperature listener unsubscribed", self.zone_name)
 
+        # Unsubscribe from notify device registry updates
+        if self._device_registry_unsub:
+            self._device_registry_unsub()
+            self._device_registry_unsub = None
+
         # Finalize any ongoing heating session
         if self._is_heating_realtime and self._heating_start_time is not None:
             duration = time.time() - self._heating_start_time
             self._heating_seconds_daily += duration
-            if self.heater_power is not None and self.heater_power > 0:
-                energy_kwh = (self.heater_power / 1000) * (duration / 3600)
+            if self._heater_kwh_per_second:
+                energy_kwh = self._heater_kwh_per_second * duration
                 self._estimated_energy_daily_kwh += energy_kwh
             _LOGGER.info("[%s] Finalized heating session on shutdown: %.1fs", self.zone_name, duration)
 
         # Save data before shutdown
-        await self.async_save_data(force=True)
+        await self.async_save_data()
 
     async def _async_load_data(self) -> None:
         """Load persisted data from storage."""
@@ -545,34 +620,10 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if "thermal_model" in data:
                     self.thermal_model.from_dict(data["thermal_model"])
 
-                # Restore energy counters
-                if "measured_energy_total_kwh" in data:
-                    self._measured_energy_total_kwh = data["measured_energy_total_kwh"]
-                if "measured_energy_daily_kwh" in data:
-                    self._measured_energy_daily_kwh = data["measured_energy_daily_kwh"]
-                if "last_daily_reset_date" in data:
-                    self._last_daily_reset_date = data["last_daily_reset_date"]
-                if "daily_reset_datetime" in data:
-                    # Restore as string, will be converted on next update
-                    pass
-
-                # Restore tracking values
-                if "last_indoor_temp" in data:
-                    self._last_indoor_temp = data["last_indoor_temp"]
-                if "last_heating_state" in data:
-                    self._last_heating_state = data["last_heating_state"]
-                if "last_power_value" in data:
-                    self._last_power_value = data["last_power_value"]
-
-                # Restore daily counters (minuit-minuit)
-                if "estimated_energy_daily_kwh" in data:
-                    self._estimated_energy_daily_kwh = data["estimated_energy_daily_kwh"]
-                if "heating_seconds_daily" in data:
-                    self._heating_seconds_daily = data["heating_seconds_daily"]
-                if "delta_t_sum_daily" in data:
-                    self._delta_t_sum_daily = data["delta_t_sum_daily"]
-                if "delta_t_count_daily" in data:
-                    self._delta_t_count_daily = data["delta_t_count_daily"]
+                # Restore energy counters, tracking values and daily counters
+                for key in PERSISTED_SCALARS:
+                    if key in data:
+                        setattr(self, f"_{key}", data[key])
 
                 # Restore rolling 24h temperature history (purge old entries)
                 if "indoor_temp_history_24h" in data:
@@ -603,37 +654,36 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             _LOGGER.error("Error loading persisted data: %s", err)
 
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist (called by the store when it writes)."""
+        self._save_scheduled = False
+        data: dict[str, Any] = {key: getattr(self, f"_{key}") for key in PERSISTED_SCALARS}
+        data["thermal_model"] = self.thermal_model.to_dict()
+        # Rolling 24h temperature history
+        data["indoor_temp_history_24h"] = self._indoor_temp_history_24h
+        return data
+
     async def async_save_data(self) -> None:
-        """Save data to persistent storage."""
+        """Save data to persistent storage now."""
         try:
-            data = {
-                "thermal_model": self.thermal_model.to_dict(),
-                "measured_energy_total_kwh": self._measured_energy_total_kwh,
-                "measured_energy_daily_kwh": self._measured_energy_daily_kwh,
-                "last_daily_reset_date": self._last_daily_reset_date,
-                "last_indoor_temp": self._last_indoor_temp,
-                "last_heating_state": self._last_heating_state,
-                "last_power_value": self._last_power_value,
-                # Daily counters (minuit-minuit)
-                "estimated_energy_daily_kwh": self._estimated_energy_daily_kwh,
-                "heating_seconds_daily": self._heating_seconds_daily,
-                "delta_t_sum_daily": self._delta_t_sum_daily,
-                "delta_t_count_daily": self._delta_t_count_daily,
-                # Rolling 24h temperature history
-                "indoor_temp_history_24h": self._indoor_temp_history_24h,
-                # Note: energy_sensor_daily_kwh is read directly from sensor, not stored
-            }
-            await self._store.async_save(data)
-            self._last_save_time = dt_util.utcnow().timestamp()
+            await self._store.async_save(self._data_to_save())
             _LOGGER.debug("Saved data for zone %s", self.zone_name)
         except Exception as err:
             _LOGGER.error("Error saving data: %s", err)
 
-    async def _async_maybe_save(self) -> None:
-        """Save data if enough time has passed since last save."""
-        now = dt_util.utcnow().timestamp()
-        if now - self._last_save_time >= SAVE_INTERVAL_SECONDS:
-            await self.async_save_data()
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a debounced save, unless one is already pending.
+
+        Store.async_delay_save re-arms its timer on every call, so calling it
+        on each update cycle (shorter than the save delay) would postpone the
+        write indefinitely.
+        """
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._store.async_delay_save(self._data_to_save, SAVE_INTERVAL_SECONDS)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sensors and update thermal model."""
@@ -648,7 +698,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.debug("[%s] Temperature sensors not available yet, returning restored data", self.zone_name)
                 return self._get_restored_data()
 
-            now = dt_util.utcnow().timestamp()
+            now = time.time()
             now_dt = dt_util.now()
 
             # Check for daily reset (midnight)
@@ -726,8 +776,8 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 ongoing_duration = now - self._heating_start_time
                 heating_seconds += ongoing_duration
                 # Add energy from current ongoing heating session
-                if self.heater_power is not None and self.heater_power > 0:
-                    ongoing_energy_kwh = (self.heater_power / 1000) * (ongoing_duration / 3600)
+                if self._heater_kwh_per_second:
+                    ongoing_energy_kwh = self._heater_kwh_per_second * ongoing_duration
                     estimated_energy += ongoing_energy_kwh
             heating_hours_daily = heating_seconds / 3600
 
@@ -767,7 +817,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
 
             # Periodically save data to persistent storage
-            await self._async_maybe_save()
+            self._async_schedule_save()
 
             return {
                 # Current values
@@ -807,6 +857,9 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "storage_loaded": self._data_loaded,
                 # 7-day history status
                 "history_days": analysis.get("history_days", 0),
+                # Entities read thermal_model.daily_history directly (K sparkline, COP days):
+                # keep a history token in data so always_update=False still notifies them
+                "history_last_date": analysis.get("history_last_date"),
                 "history_has_valid_k": analysis.get("history_has_valid_k", False),
                 # Configuration
                 "heater_power": self.heater_power,
@@ -868,6 +921,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "data_ready": False,
             "storage_loaded": self._data_loaded,
             "history_days": 0,
+            "history_last_date": None,
             "history_has_valid_k": False,
             "heater_power": self.heater_power,
             "effective_power": self.heater_power,
@@ -916,8 +970,8 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ongoing_duration = time.time() - self._heating_start_time
             heating_seconds += ongoing_duration
             # Add energy from current ongoing heating session
-            if self.heater_power is not None and self.heater_power > 0:
-                ongoing_energy_kwh = (self.heater_power / 1000) * (ongoing_duration / 3600)
+            if self._heater_kwh_per_second:
+                ongoing_energy_kwh = self._heater_kwh_per_second * ongoing_duration
                 estimated_energy += ongoing_energy_kwh
         heating_hours_daily = heating_seconds / 3600
 
@@ -959,6 +1013,9 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "storage_loaded": self._data_loaded,
             # 7-day history status
             "history_days": analysis.get("history_days", 0),
+            # Entities read thermal_model.daily_history directly (K sparkline, COP days):
+            # keep a history token in data so always_update=False still notifies them
+            "history_last_date": analysis.get("history_last_date"),
             "history_has_valid_k": analysis.get("history_has_valid_k", False),
             # Configuration
             "heater_power": self.heater_power,
@@ -1232,9 +1289,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._wind_speed_count_daily += 1
 
         if wind_direction is not None:
-            self._wind_direction_counts_daily[wind_direction] = (
-                self._wind_direction_counts_daily.get(wind_direction, 0) + 1
-            )
+            self._wind_direction_counts_daily[wind_direction] += 1
 
     def _get_daily_wind_averages(self) -> tuple[float | None, str | None]:
         """Calculate average wind speed and dominant direction for the day."""
@@ -1246,7 +1301,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Dominant wind direction (most frequent)
         dominant_direction = None
         if self._wind_direction_counts_daily:
-            dominant_direction = max(self._wind_direction_counts_daily, key=self._wind_direction_counts_daily.get)
+            dominant_direction = self._wind_direction_counts_daily.most_common(1)[0][0]
 
         return avg_wind_speed, dominant_direction
 
@@ -1254,7 +1309,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Reset wind counters at midnight."""
         self._wind_speed_sum_daily = 0.0
         self._wind_speed_count_daily = 0
-        self._wind_direction_counts_daily = {}
+        self._wind_direction_counts_daily = Counter()
 
     def _get_temperature(self, entity_id: str) -> float | None:
         """Get temperature from sensor entity, converted to Celsius.
@@ -1263,7 +1318,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Fahrenheit-configured Home Assistant instances.
         """
         state = self.hass.states.get(entity_id)
-        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if state is None or state.state in UNAVAILABLE_STATES:
             return None
         try:
             temp_value = float(state.state)
@@ -1342,7 +1397,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
 
         state = self.hass.states.get(self.energy_sensor)
-        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if state is None or state.state in UNAVAILABLE_STATES:
             return None
         try:
             return float(state.state)
@@ -1383,7 +1438,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return result
 
         state = self.hass.states.get(self.weather_entity)
-        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if state is None or state.state in UNAVAILABLE_STATES:
             return result
 
         attrs = state.attributes
@@ -1404,9 +1459,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 bearing = int(wind_bearing)
                 result["wind_bearing"] = bearing
                 # Convert bearing to direction (N, NE, E, SE, S, SW, W, NW)
-                directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-                index = int(((bearing + 22.5) % 360) / 45)
-                result["wind_direction"] = directions[index]
+                result["wind_direction"] = WIND_DIRECTIONS[WIND_SECTOR_BY_BEARING[bearing % 360]]
             except (ValueError, TypeError):
                 pass
 
@@ -1455,8 +1508,6 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return status
 
             # Get last 7 days
-            from datetime import datetime, timedelta
-
             today = datetime.now().date()
             last_7_days = []
 
@@ -1540,17 +1591,10 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             - "exposed": Wind within ±45° of facade direction
             - "sheltered": Wind outside ±45° of facade direction
         """
-        # Direction order for calculation (lowercase)
-        directions = ["n", "ne", "e", "se", "s", "sw", "w", "nw"]
-
         # Normalize inputs to lowercase for comparison
-        wind_dir_lower = wind_direction.lower() if wind_direction else ""
-        room_orient_lower = room_orientation.lower() if room_orientation else ""
-
-        try:
-            wind_idx = directions.index(wind_dir_lower)
-            room_idx = directions.index(room_orient_lower)
-        except ValueError:
+        wind_idx = DIRECTION_INDEX.get(wind_direction.lower() if wind_direction else "")
+        room_idx = DIRECTION_INDEX.get(room_orientation.lower() if room_orientation else "")
+        if wind_idx is None or room_idx is None:
             return "unknown"
 
         # Calculate angular difference (0-4 steps, where 4 is opposite)
@@ -1577,7 +1621,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # If power sensor is configured, use it EXCLUSIVELY (no fallback)
         if self.power_sensor:
             power_state = self.hass.states.get(self.power_sensor)
-            if power_state and power_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if power_state and power_state.state not in UNAVAILABLE_STATES:
                 try:
                     power_w = float(power_state.state)
                     is_heating = power_w > self.power_threshold
@@ -1654,7 +1698,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Priority 1: Use real window/door sensor if configured
         if self.window_sensor:
             state = self.hass.states.get(self.window_sensor)
-            if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            if state and state.state not in UNAVAILABLE_STATES:
                 is_open = state.state == STATE_ON
                 return (is_open, "sensor")
             # Sensor unavailable - fall back to temperature detection
@@ -1721,7 +1765,7 @@ class HomePerformanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Get current power value
         power_state = self.hass.states.get(self.power_sensor)
-        if power_state is None or power_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if power_state is None or power_state.state in UNAVAILABLE_STATES:
             return None
 
         try:
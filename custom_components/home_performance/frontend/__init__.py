@@ -47,9 +47,15 @@ class JSModuleRegistration:
             )
 
     async def _async_register_path(self) -> None:
-        """Register static HTTP paths (current + legacy for backward compat)."""
+        """Register static HTTP paths (current + legacy for backward compat).
+
+        Cache headers are enabled on the current path only: its Lovelace resource
+        URL carries a ``?v=<version>`` query string, so an upgrade busts the cache.
+        The legacy path only serves old, unversioned hand-added URLs and stays
+        uncached so those users get the new card after an upgrade.
+        """
         paths_to_register = [
-            StaticPathConfig(URL_BASE, str(WWW_PATH), False),
+            StaticPathConfig(URL_BASE, str(WWW_PATH), True),
             StaticPathConfig(LEGACY_URL_BASE, str(WWW_PATH), False),
         ]
         for path_config in paths_to_register:
@@ -85,28 +91,25 @@ class JSModuleRegistration:
         """Register or update JavaScript modules, then clean up legacy URLs."""
         _LOGGER.debug("Installing JavaScript modules")
 
-        existing_resources = [r for r in self.lovelace.resources.async_items() if r["url"].startswith(URL_BASE)]
+        existing_resources = {
+            self._get_path(r["url"]): r for r in self.lovelace.resources.async_items() if r["url"].startswith(URL_BASE)
+        }
 
         for module in JSMODULES:
             url = f"{URL_BASE}/{module['filename']}"
             try:
-                registered = False
-                for resource in existing_resources:
-                    if self._get_path(resource["url"]) == url:
-                        registered = True
-                        if self._get_version(resource["url"]) != module["version"]:
-                            _LOGGER.info("Updating %s to version %s", module["name"], module["version"])
-                            await self.lovelace.resources.async_update_item(
-                                resource["id"],
-                                {"res_type": "module", "url": f"{url}?v={module['version']}"},
-                            )
-                        break
-
-                if not registered:
+                resource = existing_resources.get(url)
+                if resource is None:
                     _LOGGER.info("Registering %s version %s", module["name"], module["version"])
                     await self.lovelace.resources.async_create_item(
                         {"res_type": "module", "url": f"{url}?v={module['version']}"}
                     )
+                elif self._get_version(resource["url"]) != module["version"]:
+                    _LOGGER.info("Updating %s to version %s", module["name"], module["version"])
+                    await self.lovelace.resources.async_update_item(
+                        resource["id"],
+                        {"res_type": "module", "url": f"{url}?v={module['version']}"},
+                    )
             except Exception:
                 _LOGGER.exception("Failed to register/update resource %s", module["name"])
 
@@ -853,6 +853,9 @@ class ThermalLossModel:
             "data_ready": self.data_hours >= MIN_DATA_HOURS,
             # History status
             "history_days": len(self._daily_history),
+            # Last archived day: with history_days, changes whenever the history does
+            # (entries are only appended, trimmed from the front or cleared)
+            "history_last_date": self._daily_history[-1].date if self._daily_history else None,
             "history_has_valid_k": self._k_coefficient_7d is not None,
             "last_k_date": self._last_k_date,
             # Configuration and derived values
@@ -10,15 +10,14 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import DOMAIN, SENSOR_ENTITY_SUFFIXES, VERSION
-from .coordinator import HomePerformanceCoordinator
+from .coordinator import HomePerformanceConfigEntry, HomePerformanceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,11 +104,11 @@ def get_energy_performance(
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: HomePerformanceConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Home Performance sensors."""
-    coordinator: HomePerformanceCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     zone_name = coordinator.zone_name
 
     entities = [
@@ -160,8 +159,7 @@ class HomePerformanceBaseSensor(CoordinatorEntity[HomePerformanceCoordinator], S
         """Initialize the sensor."""
         self._zone_name = zone_name
         self._sensor_type = sensor_type
-        # Use slugify for consistent handling of special characters (ü, é, ç, etc.)
-        zone_slug = slugify(zone_name, separator="_")
+        zone_slug = coordinator.zone_slug
 
         # Set unique_id and suggested_object_id BEFORE super().__init__()
         # to ensure they are available when the entity is registered
@@ -172,18 +170,16 @@ class HomePerformanceBaseSensor(CoordinatorEntity[HomePerformanceCoordinator], S
         suffix = SENSOR_ENTITY_SUFFIXES.get(sensor_type, sensor_type)
         self._attr_suggested_object_id = f"home_performance_{zone_slug}_{suffix}"
 
-        super().__init__(coordinator)
+        # Device info never changes for a zone: build it once
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, zone_name)},
+            name=f"Home Performance - {zone_name}",
+            manufacturer="Home Performance",
+            model="Thermal Analyzer",
+            sw_version=VERSION,
+        )
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._zone_name)},
-            "name": f"Home Performance - {self._zone_name}",
-            "manufacturer": "Home Performance",
-            "model": "Thermal Analyzer",
-            "sw_version": VERSION,
-        }
+        super().__init__(coordinator)
 
 
 class ThermalLossCoefficientSensor(HomePerformanceBaseSensor):
@@ -0,0 +1,79 @@
+"""Tests for Home Performance coordinator real-time window detection."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.home_performance.coordinator import HomePerformanceCoordinator
+
+
+def _temp_event(value: str, old_value: str | None = None) -> MagicMock:
+    """Build a state_changed event for the indoor temperature sensor."""
+    event = MagicMock()
+    old_state = MagicMock(state=old_value, attributes={}) if old_value is not None else None
+    event.data = {"new_state": MagicMock(state=value, attributes={}), "old_state": old_state}
+    return event
+
+
+class TestTemperatureListener:
+    """Test the real-time temperature listener used for window detection."""
+
+    @pytest.fixture
+    def coordinator(self):
+        """Create a coordinator with only the state used by the temperature listener."""
+        coordinator = object.__new__(HomePerformanceCoordinator)
+        coordinator.hass = MagicMock()
+        coordinator.zone_name = "Salon"
+        coordinator.indoor_temp_sensor = "sensor.salon_temperature"
+        coordinator._last_temp_value = None
+        coordinator._last_temp_time = None
+        coordinator._window_open_realtime = False
+        coordinator._window_open_since = None
+        coordinator._consecutive_drops = 0
+        coordinator._is_heating_realtime = False
+        coordinator._temp_listener_unsub = None
+        coordinator._schedule_window_notification = MagicMock()
+        coordinator._cancel_window_notification = MagicMock()
+        return coordinator
+
+    @pytest.fixture
+    def send(self, coordinator):
+        """Set up the listener and return a helper feeding (timestamp, event) pairs."""
+        with patch("custom_components.home_performance.coordinator.async_track_state_change_event") as mock_track:
+            coordinator._setup_temperature_listener()
+        handler = mock_track.call_args[0][2]
+
+        def _send(now: float, event: MagicMock) -> None:
+            with patch("custom_components.home_performance.coordinator.time.time", return_value=now):
+                handler(event)
+
+        return _send
+
+    def test_same_value_reading_advances_timestamp(self, coordinator, send):
+        """Test that repeated identical readings still count as samples."""
+        send(0, _temp_event("20.0"))
+        send(600, _temp_event("20.0", "20.0"))
+
+        assert coordinator._last_temp_time == 600
+
+    def test_drop_after_steady_readings_opens_window(self, coordinator, send):
+        """Test that a fast drop after steady same-value readings is detected."""
+        send(0, _temp_event("20.0"))
+        send(300, _temp_event("20.0", "20.0"))
+        send(600, _temp_event("20.0", "20.0"))
+        send(630, _temp_event("19.0", "20.0"))
+        send(660, _temp_event("18.0", "19.0"))
+
+        assert coordinator._window_open_realtime is True
+
+    def test_steady_same_value_readings_close_window(self, coordinator, send):
+        """Test that an open window closes after 5 minutes of same-value readings."""
+        coordinator._window_open_realtime = True
+        coordinator._window_open_since = 1
+        send(1, _temp_event("18.0"))
+        send(400, _temp_event("18.0", "18.0"))
+
+        assert coordinator._window_open_realtime is False
+        coordinator._cancel_window_notification.assert_called_once()
@@ -140,6 +140,19 @@ class TestJSModuleRegistrationRegisterPath:
         assert URL_BASE in registered_paths
         assert LEGACY_URL_BASE in registered_paths
 
+    @pytest.mark.asyncio
+    async def test_register_path_cache_headers(self, mock_hass):
+        """Test that only the current (versioned) path is registered with cache headers."""
+        registration = JSModuleRegistration(mock_hass)
+
+        await registration._async_register_path()
+
+        cache_headers = {
+            call[0][0][0].url_path: call[0][0][0].cache_headers
+            for call in mock_hass.http.async_register_static_paths.call_args_list
+        }
+        assert cache_headers == {URL_BASE: True, LEGACY_URL_BASE: False}
+
     @pytest.mark.asyncio
     async def test_register_path_handles_runtime_error(self, mock_hass):
         """Test that _async_register_path handles already registered path."""
@@ -276,6 +276,25 @@ class TestThermalLossModel:
         assert analysis["data_hours"] == 0.0
         assert analysis["samples_count"] == 0
         assert analysis["data_ready"] is False
+        assert analysis["history_last_date"] is None
+
+    def test_get_analysis_history_token(self, model: ThermalLossModel):
+        """Test get_analysis exposes the last archived date as a history change token."""
+        for date in ("2025-01-15", "2025-01-16"):
+            model.add_daily_summary(
+                date=date,
+                heating_hours=8.0,
+                avg_delta_t=10.0,
+                energy_kwh=12.0,
+                avg_indoor_temp=20.0,
+                avg_outdoor_temp=10.0,
+                sample_count=100,
+            )
+
+        analysis = model.get_analysis()
+
+        assert analysis["history_days"] == 2
+        assert analysis["history_last_date"] == "2025-01-16"
 
     def test_clear_history(self, model: ThermalLossModel):
         """Test clear_history method."""
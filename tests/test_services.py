@@ -0,0 +1,107 @@
+"""Tests for Home Performance services."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.home_performance import (
+    RESET_METHODS,
+    SERVICE_RESET_ALL,
+    SERVICE_RESET_HISTORY,
+    _async_handle_reset,
+    _get_zone_coordinator,
+)
+from custom_components.home_performance.const import DOMAIN
+
+
+class TestGetZoneCoordinator:
+    """Test zone name lookup used by the reset services."""
+
+    @pytest.fixture
+    def mock_hass(self):
+        """Create a mock hass with one indexed zone."""
+        mock = MagicMock()
+        mock.data = {DOMAIN: {"_zones_by_name": {"salon": MagicMock(zone_name="Salon")}}}
+        return mock
+
+    def test_lookup_is_case_insensitive(self, mock_hass):
+        """Test that zone lookup ignores case."""
+        coordinator = _get_zone_coordinator(mock_hass, "SALON")
+        assert coordinator.zone_name == "Salon"
+
+    def test_unknown_zone_raises(self, mock_hass):
+        """Test that an unknown zone raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            _get_zone_coordinator(mock_hass, "Chambre")
+
+    def test_missing_index_raises(self):
+        """Test that lookup without any configured zone raises ValueError."""
+        mock_hass = MagicMock()
+        mock_hass.data = {DOMAIN: {}}
+        with pytest.raises(ValueError):
+            _get_zone_coordinator(mock_hass, "Salon")
+
+
+class TestResetMethods:
+    """Test reset service to coordinator method mapping."""
+
+    def test_every_service_maps_to_coordinator_method(self):
+        """Test that each reset service dispatches to an existing coordinator method."""
+        from custom_components.home_performance.coordinator import HomePerformanceCoordinator
+
+        for method in RESET_METHODS.values():
+            assert callable(getattr(HomePerformanceCoordinator, method))
+
+
+class TestHandleReset:
+    """Test the module-level reset service handler."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator."""
+        return MagicMock(zone_name="Salon")
+
+    @pytest.fixture
+    def mock_call(self, mock_coordinator):
+        """Create a mock service call targeting the Salon zone."""
+        call = MagicMock()
+        call.hass.data = {DOMAIN: {"_zones_by_name": {"salon": mock_coordinator}}}
+        call.data = {"zone_name": "Salon"}
+        return call
+
+    @pytest.mark.asyncio
+    async def test_reset_history_dispatch(self, mock_call, mock_coordinator):
+        """Test that reset_history calls the coordinator's reset_history."""
+        mock_call.service = SERVICE_RESET_HISTORY
+
+        await _async_handle_reset(mock_call)
+
+        mock_coordinator.reset_history.assert_called_once()
+        mock_coordinator.reset_all_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reset_all_dispatch(self, mock_call, mock_coordinator):
+        """Test that reset_all calls the coordinator's reset_all_data."""
+        mock_call.service = SERVICE_RESET_ALL
+
+        await _async_handle_reset(mock_call)
+
+        mock_coordinator.reset_all_data.assert_called_once()
+        mock_coordinator.reset_history.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reset_all_targets_named_zone(self, mock_call, mock_coordinator):
+        """Test that reset_all only resets the coordinator of the named zone."""
+        other_coordinator = MagicMock(zone_name="Chambre")
+        mock_call.hass.data[DOMAIN]["_zones_by_name"]["chambre"] = other_coordinator
+        mock_call.service = SERVICE_RESET_ALL
+        mock_call.data = {"zone_name": "SALON"}
+
+        await _async_handle_reset(mock_call)
+
+        mock_coordinator.reset_all_data.assert_called_once()
+        mock_coordinator.reset_history.assert_not_called()
+        other_coordinator.reset_all_data.assert_not_called()
+        other_coordinator.reset_history.assert_not_called()